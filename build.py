@@ -1,14 +1,175 @@
 #!/usr/bin/env python3
 """Build script for Claude Usage Monitor."""
 
+import argparse
+import hashlib
+import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Already-compressed formats gain nothing from deflate; store them as-is
+STORED_SUFFIXES = {".exe", ".pyd", ".dll", ".zip"}
 
-def main():
+# Written into the venv after a successful `uv sync --all-extras`
+SYNC_STAMP = ".build-synced"
+
+
+def remove_tree(path: Path) -> None:
+    """
+    Delete a directory tree, using robocopy on Windows when available.
+
+    Mirroring an empty directory with robocopy's multithreaded I/O is much
+    faster than shutil.rmtree for PyInstaller's thousands of small files.
+    """
+    if not path.exists():
+        return
+
+    if shutil.which("robocopy"):
+        # Mirror an empty directory over the tree; rmtree below then only has
+        # to remove the (now empty) root, or does the full job if robocopy failed
+        with tempfile.TemporaryDirectory() as empty_dir:
+            subprocess.run(
+                [
+                    "robocopy",
+                    empty_dir,
+                    str(path),
+                    "/MIR",
+                    "/MT:64",
+                    "/NFL",
+                    "/NDL",
+                    "/NJH",
+                    "/NJS",
+                ],
+                capture_output=True,
+            )
+
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a single file, using the native CopyFileW API on Windows."""
+    if sys.platform == "win32":
+        import ctypes
+
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+    else:
+        shutil.copy(src, dst)
+
+
+def fast_copy(src_files: list[Path], dst_dir: Path) -> None:
+    """
+    Copy files into dst_dir in parallel.
+
+    Each copy is issued from a worker thread so wall time is bounded by disk
+    queue depth rather than file count.
+    """
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    workers = min(16, len(src_files)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() re-raises the first copy failure, if any
+        list(pool.map(lambda src: _copy_file(src, dst_dir / src.name), src_files))
+
+
+def _iter_files(directory: Path) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries under directory using os.scandir."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(Path(entry.path))
+            elif entry.is_file():
+                yield entry
+
+
+def make_zip(archive_name: Path, source_dir: Path) -> Path:
+    """
+    Zip the contents of source_dir into archive_name + ".zip".
+
+    Files are streamed into the archive in a single scandir pass. Formats that
+    are already compressed are stored rather than deflated again.
+    """
+    zip_path = archive_name.with_name(archive_name.name + ".zip")
+    zip_path.unlink(missing_ok=True)
+
+    with zipfile.ZipFile(
+        zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=6
+    ) as archive:
+        for entry in _iter_files(source_dir):
+            path = Path(entry.path)
+            # The archive may live inside source_dir; don't zip it into itself
+            if path == zip_path:
+                continue
+            compress_type = (
+                zipfile.ZIP_STORED
+                if path.suffix.lower() in STORED_SUFFIXES
+                else zipfile.ZIP_DEFLATED
+            )
+            archive.write(
+                path, path.relative_to(source_dir), compress_type=compress_type
+            )
+
+    return zip_path
+
+
+def upx_available() -> bool:
+    """Check whether UPX is installed (PyInstaller silently skips it otherwise)."""
+    if not shutil.which("upx"):
+        return False
+    return subprocess.run(["upx", "--version"], capture_output=True).returncode == 0
+
+
+def _venv_dir(project_root: Path) -> Path:
+    """Return the project environment uv syncs into."""
+    env_dir = os.environ.get("UV_PROJECT_ENVIRONMENT")
+    return project_root / env_dir if env_dir else project_root / ".venv"
+
+
+def _sync_fingerprint(project_root: Path) -> str:
+    """Hash uv.lock and pyproject.toml, the inputs that decide what uv installs."""
+    digest = hashlib.sha256()
+    for name in ("uv.lock", "pyproject.toml"):
+        path = project_root / name
+        digest.update(path.read_bytes() if path.exists() else b"")
+    return digest.hexdigest()
+
+
+def needs_sync(project_root: Path) -> bool:
+    """
+    Check whether the venv needs `uv sync --all-extras` before building.
+
+    A plain `uv sync` or `uv run` leaves out the build extras, so the venv only
+    counts as synced when the stamp from our own sync matches the current
+    lockfile and pyproject.
+    """
+    stamp = _venv_dir(project_root) / SYNC_STAMP
+    try:
+        return stamp.read_text() != _sync_fingerprint(project_root)
+    except OSError:
+        return True
+
+
+def mark_synced(project_root: Path) -> None:
+    """Record that the venv was synced with all extras for the current lockfile."""
+    stamp = _venv_dir(project_root) / SYNC_STAMP
+    stamp.write_text(_sync_fingerprint(project_root))
+
+
+def main(argv: list[str] | None = None):
     """Build the application."""
+    parser = argparse.ArgumentParser(description="Build Claude Usage Monitor.")
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="discard PyInstaller's build/ cache and do a full rebuild",
+    )
+    args = parser.parse_args(argv)
+
     project_root = Path(__file__).parent
     dist_dir = project_root / "dist"
     build_dir = project_root / "build"
@@ -19,21 +180,31 @@ def main():
 
     # Clean previous builds
     print("\n[1/4] Cleaning previous builds...")
-    shutil.rmtree(dist_dir, ignore_errors=True)
-    shutil.rmtree(build_dir, ignore_errors=True)
+    remove_tree(dist_dir)
+    # build/ holds PyInstaller's analysis cache; keep it for incremental builds
+    if args.clean:
+        remove_tree(build_dir)
     print("  Done.")
 
     # Install dependencies using uv
     print("\n[2/4] Installing dependencies with uv...")
-    subprocess.run(["uv", "sync", "--all-extras"], check=True)
-    print("  Done.")
+    if needs_sync(project_root):
+        subprocess.run(["uv", "sync", "--all-extras"], check=True)
+        mark_synced(project_root)
+        print("  Done.")
+    else:
+        print("  Up to date, skipped.")
 
     # Run PyInstaller via uv
     print("\n[3/4] Building executable...")
-    result = subprocess.run(
-        ["uv", "run", "pyinstaller", "--clean", "build.spec"],
-        capture_output=False,
-    )
+    if upx_available():
+        print("  UPX found, binaries will be compressed.")
+    else:
+        print("  UPX not found on PATH, binaries will not be compressed.")
+    pyinstaller_cmd = ["uv", "run", "pyinstaller", "build.spec"]
+    if args.clean:
+        pyinstaller_cmd.append("--clean")
+    result = subprocess.run(pyinstaller_cmd, capture_output=False)
 
     if result.returncode != 0:
         print("\n  ERROR: Build failed!")
@@ -43,22 +214,23 @@ def main():
 
     # Copy additional files to dist
     print("\n[4/4] Copying additional files...")
+    extra_files = [project_root / "config.example.json"]
     if (project_root / "README.md").exists():
-        shutil.copy(project_root / "README.md", dist_dir)
-    shutil.copy(project_root / "config.example.json", dist_dir)
+        extra_files.append(project_root / "README.md")
+    fast_copy(extra_files, dist_dir)
     print("  Done.")
 
     # Create release zip
     print("\nCreating release archive...")
     archive_name = dist_dir / "ClaudeMonitor-v1.0.0-win64"
-    shutil.make_archive(str(archive_name), "zip", dist_dir)
-    print(f"  Created: {archive_name}.zip")
+    archive_path = make_zip(archive_name, dist_dir)
+    print(f"  Created: {archive_path}")
 
     print("\n" + "=" * 60)
     print("BUILD COMPLETE!")
     print("=" * 60)
     print(f"\nExecutable: {dist_dir / 'ClaudeMonitor.exe'}")
-    print(f"Archive:    {archive_name}.zip")
+    print(f"Archive:    {archive_path}")
 
     return 0
 
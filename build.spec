@@ -1,10 +1,19 @@
 # -*- mode: python ; coding: utf-8 -*-
 """PyInstaller spec file for Claude Usage Monitor."""
 
+import sys
 from pathlib import Path
 
 block_cipher = None
 
+# Runtime DLLs that must not be UPX-packed (corrupts or slows their loading)
+UPX_EXCLUDE = [
+    'vcruntime140.dll',
+    'vcruntime140_1.dll',
+    'python3.dll',
+    f'python3{sys.version_info.minor}.dll',
+]
+
 # Get the base directory
 BASE_DIR = Path(SPECPATH)
 
@@ -40,6 +49,9 @@ a = Analysis(
         'notebook',
         'IPython',
         'tkinter',
+        'unittest',
+        'test',
+        'pydoc',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -59,9 +71,9 @@ exe = EXE(
     name='ClaudeMonitor',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
+    strip=not sys.platform.startswith('win'),  # No strip tool for Windows DLLs
+    upx=True,  # Only applied when UPX is on PATH (see build.py)
+    upx_exclude=UPX_EXCLUDE,
     runtime_tmpdir=None,
     console=False,  # No console window
     disable_windowed_traceback=False,
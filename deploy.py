@@ -1,19 +1,114 @@
 #!/usr/bin/env python3
 """Deploy script - builds, installs, and runs Claudometer."""
 
+import argparse
+import ctypes
 import os
-import shutil
 import subprocess
 import sys
 import winreg
+from ctypes import wintypes
 from pathlib import Path
 
+from build import fast_copy
+
 INSTALL_DIR = Path(os.environ["LOCALAPPDATA"]) / "Claudometer"
 EXE_NAME = "ClaudeMonitor.exe"
+SERIALIZE_KEY = r"Software\Microsoft\Windows\CurrentVersion\Explorer\Serialize"
+
+TH32CS_SNAPPROCESS = 0x00000002
+PROCESS_TERMINATE = 0x0001
+SYNCHRONIZE = 0x00100000
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """Win32 PROCESSENTRY32W structure used by the Toolhelp process APIs."""
+
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
+
+
+def _load_kernel32() -> ctypes.WinDLL:
+    """Load kernel32 with explicit signatures so 64-bit handles aren't truncated."""
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    entry_ptr = ctypes.POINTER(PROCESSENTRY32W)
+
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, entry_ptr]
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, entry_ptr]
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    kernel32.TerminateProcess.restype = wintypes.BOOL
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    return kernel32
+
 
+def kill_processes(exe_name: str, timeout_ms: int = 5000) -> int:
+    """
+    Terminate every running process whose image name matches exe_name.
 
-def main():
+    Waits (up to timeout_ms each) for the processes to exit so their exe is
+    no longer locked when this returns.
+
+    Returns:
+        Number of processes terminated.
+    """
+    kernel32 = _load_kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        return 0
+
+    killed = 0
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == exe_name.lower():
+                handle = kernel32.OpenProcess(
+                    PROCESS_TERMINATE | SYNCHRONIZE, False, entry.th32ProcessID
+                )
+                if handle:
+                    if kernel32.TerminateProcess(handle, 0):
+                        kernel32.WaitForSingleObject(handle, timeout_ms)
+                        killed += 1
+                    kernel32.CloseHandle(handle)
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+    return killed
+
+
+def main(argv: list[str] | None = None):
     """Build, install, and run Claudometer."""
+    parser = argparse.ArgumentParser(description="Build, install, and run Claudometer.")
+    parser.add_argument(
+        "--no-startup-delay",
+        action="store_true",
+        help="remove Explorer's post-logon delay for startup apps (affects all "
+        "startup apps for this user)",
+    )
+    args = parser.parse_args(argv)
+
     project_root = Path(__file__).parent
 
     # 1. Build
@@ -25,15 +120,11 @@ def main():
 
     # 2. Kill existing instance
     print("Stopping existing instance...")
-    subprocess.run(
-        ["taskkill", "/f", "/im", EXE_NAME],
-        capture_output=True,
-    )  # Ignore errors if not running
+    kill_processes(EXE_NAME)  # No-op if not running
 
     # 3. Install to permanent location
     print(f"Installing to {INSTALL_DIR}...")
-    INSTALL_DIR.mkdir(parents=True, exist_ok=True)
-    shutil.copy(project_root / "dist" / EXE_NAME, INSTALL_DIR / EXE_NAME)
+    fast_copy([project_root / "dist" / EXE_NAME], INSTALL_DIR)
 
     # 4. Enable startup (registry entry pointing to installed exe)
     print("Enabling startup...")
@@ -47,6 +138,15 @@ def main():
             key, "Claudometer", 0, winreg.REG_SZ, str(INSTALL_DIR / EXE_NAME)
         )
 
+    if args.no_startup_delay:
+        # Explorer holds back Run-key apps for a while after logon; this
+        # per-user value lets the tray icon appear right away
+        print("Disabling startup delay...")
+        with winreg.CreateKeyEx(
+            winreg.HKEY_CURRENT_USER, SERIALIZE_KEY, 0, winreg.KEY_WRITE
+        ) as key:
+            winreg.SetValueEx(key, "StartupDelayInMSec", 0, winreg.REG_DWORD, 0)
+
     # 5. Launch detached
     print("Launching...")
     subprocess.Popen(
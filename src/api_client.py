@@ -1,15 +1,25 @@
 """Claude API client for fetching usage data."""
 
 import logging
-from typing import Any
+import socket
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from . import json_compat
 
 logger = logging.getLogger(__name__)
 
 # Build hash from claude.ai web client — update if Anthropic rotates it
 ANTHROPIC_CLIENT_SHA = "5e8b21836eaa45572d94b89081c05d54bef86ebd"
 
+# Seconds a pooled connection may sit idle before TCP keep-alive probes start
+KEEPALIVE_IDLE_SECONDS = 120
+
 
 class ClaudeAPIError(Exception):
     """Base exception for API errors."""
@@ -37,11 +47,63 @@ class NetworkError(ClaudeAPIError):
     pass
 
 
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keep-alive on pooled connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        socket_options = [
+            *HTTPConnection.default_socket_options,
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE_SECONDS)
+            )
+        kwargs.setdefault("socket_options", socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _parse_retry_after(value: str | None, default: int = 60) -> int:
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value, or None if the header is missing
+        default: Delay to use when the header is missing or not an integer
+            (e.g. the HTTP-date form)
+
+    Returns:
+        Seconds to wait before retrying
+    """
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.debug("Unsupported Retry-After value %r, using %ss", value, default)
+        return default
+
+
 class ClaudeAPIClient:
     """Client for interacting with Claude.ai API."""
 
     BASE_URL = "https://claude.ai/api"
 
+    # Headers shared by every client; read-only, per-instance values are
+    # added on top in _setup_session
+    BASE_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "*/*",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate",
+            "Content-Type": "application/json",
+            "anthropic-client-platform": "web_claude_ai",
+            "anthropic-client-version": "1.0.0",
+            "anthropic-client-sha": ANTHROPIC_CLIENT_SHA,
+        }
+    )
+
     def __init__(self, org_id: str, session_cookie: str, device_id: str):
         """
         Initialize API client.
@@ -53,28 +115,24 @@ class ClaudeAPIClient:
         """
         self.org_id = org_id
         self.device_id = device_id
+        self._usage_url = f"{self.BASE_URL}/organizations/{org_id}/usage"
         self.session = requests.Session()
         self._setup_session(session_cookie)
         self._consecutive_failures = 0
 
     def _setup_session(self, session_cookie: str) -> None:
         """Configure session with authentication and headers."""
+        # Only one host is polled, so a single small pool is enough; keep-alive
+        # lets the connection (and its TLS session) survive between polls
+        self.session.mount(
+            "https://", _KeepAliveAdapter(pool_connections=1, pool_maxsize=2)
+        )
         self.session.cookies.set("sessionKey", session_cookie, domain="claude.ai")
         self.session.cookies.set(
             "anthropic-device-id", self.device_id, domain="claude.ai"
         )
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "*/*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Content-Type": "application/json",
-                "anthropic-client-platform": "web_claude_ai",
-                "anthropic-client-version": "1.0.0",
-                "anthropic-client-sha": ANTHROPIC_CLIENT_SHA,
-                "anthropic-device-id": self.device_id,
-            }
-        )
+        self.session.headers.update(self.BASE_HEADERS)
+        self.session.headers["anthropic-device-id"] = self.device_id
 
     def get_usage(self) -> dict[str, Any]:
         """
@@ -89,26 +147,31 @@ class ClaudeAPIClient:
             NetworkError: Connection issues
             ClaudeAPIError: Other API errors
         """
-        url = f"{self.BASE_URL}/organizations/{self.org_id}/usage"
-
         try:
-            logger.debug(f"Fetching usage from {url}")
-            resp = self.session.get(url, timeout=15)
+            logger.debug("Fetching usage from %s", self._usage_url)
+            resp = self.session.get(self._usage_url, timeout=15)
 
             if resp.status_code in (401, 403):
                 logger.warning(f"Authentication failed: {resp.status_code}")
                 raise AuthenticationError("Session cookie expired or invalid")
 
             if resp.status_code == 429:
-                retry_after = int(resp.headers.get("Retry-After", 60))
+                retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
                 logger.warning(f"Rate limited, retry after {retry_after}s")
                 raise RateLimitError(retry_after)
 
             resp.raise_for_status()
-            self._consecutive_failures = 0
 
-            data = resp.json()
-            logger.debug(f"Usage data: {data}")
+            try:
+                data = json_compat.loads(resp.content)
+            except ValueError as e:
+                self._consecutive_failures += 1
+                logger.error(f"Invalid JSON response: {e}")
+                raise ClaudeAPIError(f"Invalid JSON response: {e}")
+
+            self._consecutive_failures = 0
+            # Lazy formatting: the payload is only stringified in debug mode
+            logger.debug("Usage data: %s", data)
             return data
 
         except requests.exceptions.ConnectionError as e:
@@ -128,6 +191,11 @@ class ClaudeAPIClient:
 
     def update_cookie(self, session_cookie: str) -> None:
         """Update the session cookie."""
+        current = self.session.cookies.get("sessionKey", domain="claude.ai")
+        if current == session_cookie:
+            logger.debug("Session cookie unchanged")
+            return
+
         self.session.cookies.set("sessionKey", session_cookie, domain="claude.ai")
         self.session.cookies.set(
             "anthropic-device-id", self.device_id, domain="claude.ai"
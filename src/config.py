@@ -1,28 +1,45 @@
 """Configuration management for Claude Usage Monitor."""
 
+import functools
 import json
 import logging
 import os
 import sys
 import uuid
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from . import json_compat
+
 logger = logging.getLogger(__name__)
 
 APP_NAME = "ClaudeMonitor"
 
-DEFAULT_CONFIG = {
-    "organization_id": "",
-    "session_cookie": "",
-    "poll_interval_seconds": 300,
-    "notification_thresholds": [50, 75, 90],
-    "start_with_windows": False,
-    "debug_mode": False,
-    "device_id": "",
-}
-
-
+# Read-only; use _default_config() for a copy that can be modified
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "organization_id": "",
+        "session_cookie": "",
+        "poll_interval_seconds": 300,
+        "notification_thresholds": (50, 75, 90),
+        "start_with_windows": False,
+        "debug_mode": False,
+        "device_id": "",
+    }
+)
+
+
+def _default_config() -> dict[str, Any]:
+    """Return a fresh, mutable copy of the default configuration."""
+    config = dict(DEFAULT_CONFIG)
+    # Stored as a tuple so it can't be changed through the proxy
+    config["notification_thresholds"] = list(config["notification_thresholds"])
+    return config
+
+
+@functools.lru_cache(maxsize=1)
 def get_app_data_dir() -> Path:
     """
     Get appropriate directory for app data.
@@ -31,11 +48,14 @@ def get_app_data_dir() -> Path:
     1. CLAUDE_MONITOR_DATA env var (for portability)
     2. Same directory as exe (for portable mode if config exists there)
     3. %LOCALAPPDATA%/ClaudeMonitor (standard Windows location)
+
+    The result is cached for the life of the process.
     """
     # Check environment variable
     if env_path := os.environ.get("CLAUDE_MONITOR_DATA"):
         path = Path(env_path)
-        path.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            path.mkdir(parents=True, exist_ok=True)
         return path
 
     # Check if running as frozen exe
@@ -53,7 +73,8 @@ def get_app_data_dir() -> Path:
         # Fallback to user home
         app_dir = Path.home() / ".claude-monitor"
 
-    app_dir.mkdir(parents=True, exist_ok=True)
+    if not app_dir.exists():
+        app_dir.mkdir(parents=True, exist_ok=True)
     return app_dir
 
 
@@ -62,16 +83,20 @@ def get_config_path() -> Path:
     return get_app_data_dir() / "config.json"
 
 
+@functools.lru_cache(maxsize=1)
 def get_log_dir() -> Path:
-    """Get path to log directory."""
+    """Get path to log directory (cached for the life of the process)."""
     log_dir = get_app_data_dir() / "logs"
-    log_dir.mkdir(exist_ok=True)
+    if not log_dir.exists():
+        log_dir.mkdir(exist_ok=True)
     return log_dir
 
 
 class ConfigManager:
     """Manages application configuration."""
 
+    __slots__ = ("config_path", "_config")
+
     def __init__(self, config_path: Path | None = None):
         """
         Initialize configuration manager.
@@ -80,23 +105,35 @@ class ConfigManager:
             config_path: Optional custom config path. Uses default if not provided.
         """
         self.config_path = config_path or get_config_path()
-        self.config: dict[str, Any] = self._load()
+        # Loaded from disk on first access to the config property
+        self._config: dict[str, Any] | None = None
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Configuration values, loaded from the config file on first access."""
+        if self._config is None:
+            self._config = self._load()
+        return self._config
+
+    @config.setter
+    def config(self, value: dict[str, Any]) -> None:
+        self._config = value
 
     def _load(self) -> dict[str, Any]:
         """Load configuration from file, merging with defaults."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
+                loaded = json_compat.loads(self.config_path.read_bytes())
                 # Merge with defaults (handles new config options)
-                config = {**DEFAULT_CONFIG, **loaded}
+                config = _default_config()
+                config.update(loaded)
                 logger.info(f"Loaded config from {self.config_path}")
                 return config
             except (json.JSONDecodeError, IOError) as e:
                 logger.error(f"Failed to load config: {e}")
-                return DEFAULT_CONFIG.copy()
+                return _default_config()
         logger.info("No config file found, using defaults")
-        return DEFAULT_CONFIG.copy()
+        return _default_config()
 
     def save(self) -> bool:
         """
@@ -105,16 +142,23 @@ class ConfigManager:
         Returns:
             True if save was successful, False otherwise.
         """
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
         try:
             # Ensure directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2)
+            # Write to a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated config behind
+            with open(tmp_path, "wb") as f:
+                f.write(json_compat.dumps_pretty(self.config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
             logger.info(f"Saved config to {self.config_path}")
             return True
         except IOError as e:
             logger.error(f"Failed to save config: {e}")
+            tmp_path.unlink(missing_ok=True)
             return False
 
     def ensure_device_id(self) -> str:
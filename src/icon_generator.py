@@ -30,6 +30,14 @@ class IconGenerator:
         """
         self.size = size
         self._font = self._load_font()
+        self._glyphs = self._render_glyphs()
+        # Gauge color for each integer percentage 0-100
+        self._color_lut = tuple(self._get_color(p) for p in range(101))
+        self._background = self._render_background()
+        # Rendered icons, reused across calls; callers must not mutate them
+        self._usage_icons: dict[int, Image.Image] = {}
+        self._error_icons: dict[str, Image.Image] = {}
+        self._loading_icon: Image.Image | None = None
 
     def _load_font(self) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         """Load font for percentage text."""
@@ -47,6 +55,27 @@ class IconGenerator:
             logger.warning(f"Failed to load font: {e}")
             return ImageFont.load_default()
 
+    def _render_glyphs(self) -> list[tuple[Image.Image, tuple[int, int]]]:
+        """
+        Pre-render the percentage labels "0".."100" as alpha masks.
+
+        Each entry is the glyph mask and the position that centers it in the
+        icon, so drawing a label is a single paste instead of a FreeType
+        rasterization.
+        """
+        measure = ImageDraw.Draw(Image.new("L", (1, 1)))
+        glyphs = []
+        for n in range(101):
+            text = str(n)
+            left, top, right, bottom = measure.textbbox((0, 0), text, font=self._font)
+            mask = Image.new("L", (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=self._font)
+
+            text_x = (self.size - (right - left)) // 2
+            text_y = (self.size - (bottom - top)) // 2 - 2
+            glyphs.append((mask, (text_x + left, text_y + top)))
+        return glyphs
+
     def _get_color(self, percentage: float) -> tuple[int, int, int]:
         """Get color based on usage percentage."""
         if percentage < 50:
@@ -58,36 +87,52 @@ class IconGenerator:
         else:
             return self.COLORS["red"]
 
+    def _render_background(self) -> Image.Image:
+        """Render the gray background ring shared by all usage icons."""
+        img = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+
+        padding = 4
+        draw.ellipse(
+            [padding, padding, self.size - padding, self.size - padding],
+            outline=(80, 80, 80, 200),
+            width=6,
+        )
+
+        return img
+
     def create_usage_icon(
         self, five_hour: float = 0, seven_day: float = 0
     ) -> Image.Image:
         """
         Create icon showing the more critical usage value.
 
+        The icon only depends on the integer percentage displayed, so renders
+        are cached per percentage and the same Image is returned on later calls.
+
         Args:
             five_hour: 5-hour utilization percentage (0-100)
             seven_day: 7-day utilization percentage (0-100)
 
         Returns:
-            PIL Image object for the icon.
+            PIL Image object for the icon (shared; do not modify).
         """
         # Use higher value for display
-        percentage = max(five_hour, seven_day)
-        color = self._get_color(percentage)
+        percentage = int(max(five_hour, seven_day))
 
-        img = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
+        icon = self._usage_icons.get(percentage)
+        if icon is None:
+            icon = self._usage_icons[percentage] = self._render_usage_icon(percentage)
+        return icon
+
+    def _render_usage_icon(self, percentage: int) -> Image.Image:
+        """Render the usage gauge for an integer percentage."""
+        color = self._color_lut[min(max(percentage, 0), 100)]
+
+        img = self._background.copy()
         draw = ImageDraw.Draw(img)
 
         padding = 4
-        center = self.size // 2
-        radius = (self.size - padding * 2) // 2
-
-        # Draw background ring (gray)
-        draw.ellipse(
-            [padding, padding, self.size - padding, self.size - padding],
-            outline=(80, 80, 80, 200),
-            width=6,
-        )
 
         # Draw progress arc if percentage > 0
         if percentage > 0:
@@ -105,15 +150,19 @@ class IconGenerator:
             )
 
         # Draw percentage text in center
-        text = f"{int(percentage)}"
-        bbox = draw.textbbox((0, 0), text, font=self._font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        if 0 <= percentage < len(self._glyphs):
+            mask, position = self._glyphs[percentage]
+            img.paste(color, position, mask)
+        else:
+            text = f"{percentage}"
+            bbox = draw.textbbox((0, 0), text, font=self._font)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
 
-        text_x = (self.size - text_width) // 2
-        text_y = (self.size - text_height) // 2 - 2
+            text_x = (self.size - text_width) // 2
+            text_y = (self.size - text_height) // 2 - 2
 
-        draw.text((text_x, text_y), text, fill=color, font=self._font)
+            draw.text((text_x, text_y), text, fill=color, font=self._font)
 
         return img
 
@@ -125,8 +174,15 @@ class IconGenerator:
             error_type: Type of error ('auth_expired', 'network_error', or 'error')
 
         Returns:
-            PIL Image object for the error icon.
+            PIL Image object for the error icon (shared; do not modify).
         """
+        icon = self._error_icons.get(error_type)
+        if icon is None:
+            icon = self._error_icons[error_type] = self._render_error_icon(error_type)
+        return icon
+
+    def _render_error_icon(self, error_type: str) -> Image.Image:
+        """Render the error icon for an error type."""
         img = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
 
@@ -166,7 +222,13 @@ class IconGenerator:
         return img
 
     def create_loading_icon(self) -> Image.Image:
-        """Create icon indicating loading state."""
+        """Create icon indicating loading state (shared; do not modify)."""
+        if self._loading_icon is None:
+            self._loading_icon = self._render_loading_icon()
+        return self._loading_icon
+
+    def _render_loading_icon(self) -> Image.Image:
+        """Render the loading icon."""
         img = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
 
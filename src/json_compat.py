@@ -0,0 +1,33 @@
+"""JSON helpers that use orjson when installed, falling back to the stdlib.
+
+orjson is an optional speedup (the ``speedups`` extra). ``loads`` raises
+``json.JSONDecodeError`` (or orjson's subclass of it) on malformed input,
+including bytes that are not valid UTF-8, so callers only need to handle the
+stdlib exception.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        # orjson reports invalid UTF-8 as a decode error; match it
+        raise json.JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from e
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
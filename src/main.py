@@ -3,7 +3,6 @@
 import logging
 import sys
 import threading
-import time
 from pathlib import Path
 
 from src.api_client import (
@@ -15,7 +14,7 @@ from src.api_client import (
 )
 from src.config import ConfigManager, get_config_path, get_log_dir
 from src.notifications import NotificationManager
-from src.startup import disable_startup, enable_startup
+from src.startup import set_startup
 from src.tray_icon import TrayIconManager
 from src.utils import setup_logging
 
@@ -30,6 +29,8 @@ class ClaudeUsageMonitor:
         self.config = ConfigManager()
         self.running = False
         self.poll_thread: threading.Thread | None = None
+        # Wakes the poll thread early, for a manual refresh or shutdown
+        self._wake_event = threading.Event()
 
         # Setup logging
         setup_logging(get_log_dir(), self.config.get("debug_mode", False))
@@ -112,8 +113,8 @@ class ClaudeUsageMonitor:
     def _manual_refresh(self) -> None:
         """Handle manual refresh request from tray menu."""
         logger.info("Manual refresh triggered")
-        # Run poll in a separate thread to not block
-        threading.Thread(target=self._poll_once, daemon=True).start()
+        # Wake the poll thread instead of polling on the tray's thread
+        self._wake_event.set()
 
     def _poll_once(self) -> None:
         """Perform a single poll of the API."""
@@ -167,19 +168,19 @@ class ClaudeUsageMonitor:
                 sleep_time = base_interval
                 backoff_multiplier = 1
 
-            # Sleep in small intervals to allow for shutdown
-            for _ in range(int(sleep_time)):
-                if not self.running:
-                    return
-                time.sleep(1)
+            # Wait for the interval; a manual refresh or shutdown ends it early
+            self._wake_event.wait(timeout=sleep_time)
+            self._wake_event.clear()
 
-            if self.running:
-                self._poll_once()
+            if not self.running:
+                return
+            self._poll_once()
 
     def _shutdown(self) -> None:
         """Handle application shutdown."""
         logger.info("Shutting down...")
         self.running = False
+        self._wake_event.set()
 
     def run(self) -> int:
         """
@@ -193,10 +194,7 @@ class ClaudeUsageMonitor:
             return 1
 
         # Apply startup setting
-        if self.config.get("start_with_windows", False):
-            enable_startup()
-        else:
-            disable_startup()
+        set_startup(self.config.get("start_with_windows", False))
 
         # Setup components
         self._setup_components()
@@ -218,6 +216,7 @@ class ClaudeUsageMonitor:
             logger.info("Keyboard interrupt received")
         finally:
             self.running = False
+            self._wake_event.set()
 
         # Wait for poll thread to finish
         if self.poll_thread and self.poll_thread.is_alive():
@@ -1,7 +1,9 @@
 """Windows toast notification management."""
 
+import bisect
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any
 
 from winotify import Notification, audio
@@ -12,22 +14,17 @@ logger = logging.getLogger(__name__)
 
 APP_ID = "Claude Usage Monitor"
 
+# Toasts are shown by a single worker so the caller (the poll thread) doesn't
+# wait on winotify's PowerShell launch, and toasts are shown one at a time.
+# concurrent.futures joins the worker at interpreter exit, so toasts still
+# queued at shutdown are shown before the process exits.
+_notify_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="toast")
 
-def send_notification(
-    title: str, message: str, urgent: bool = False, launch_url: str | None = None
-) -> bool:
-    """
-    Send a Windows toast notification.
-
-    Args:
-        title: Notification title
-        message: Notification body
-        urgent: If True, play sound and use longer duration
-        launch_url: Optional URL to open when notification clicked
 
-    Returns:
-        True if notification was sent successfully
-    """
+def _show_toast(
+    title: str, message: str, urgent: bool, launch_url: str | None
+) -> None:
+    """Build and show a toast on the notification worker thread."""
     try:
         toast = Notification(
             app_id=APP_ID,
@@ -43,17 +40,44 @@ def send_notification(
             toast.add_actions(label="Open Claude", launch=launch_url)
 
         toast.show()
-        logger.info(f"Notification sent: {title}")
-        return True
+        logger.info("Notification sent: %s", title)
+    except Exception as e:
+        logger.error("Failed to send notification: %s", e)
+
+
+def send_notification(
+    title: str, message: str, urgent: bool = False, launch_url: str | None = None
+) -> bool:
+    """
+    Send a Windows toast notification.
+
+    The toast is built and shown asynchronously on a background worker thread.
 
+    Args:
+        title: Notification title
+        message: Notification body
+        urgent: If True, play sound and use longer duration
+        launch_url: Optional URL to open when notification clicked
+
+    Returns:
+        True if notification was queued successfully
+    """
+    try:
+        _notify_executor.submit(_show_toast, title, message, urgent, launch_url)
+        return True
     except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
+        logger.error("Failed to send notification: %s", e)
         return False
 
 
 class NotificationManager:
     """Manages usage threshold notifications."""
 
+    __slots__ = ("thresholds", "_notified")
+
+    # Usage periods tracked for notifications: (API key, display label)
+    _PERIODS = (("five_hour", "5-hour"), ("seven_day", "Weekly"))
+
     def __init__(self, thresholds: list[int] | None = None):
         """
         Initialize notification manager.
@@ -62,79 +86,100 @@ class NotificationManager:
             thresholds: List of percentage thresholds to notify at (e.g., [50, 75, 90])
         """
         self.thresholds = sorted(thresholds or [50, 75, 90])
-        # Track which thresholds have been notified for each period
-        self._notified: dict[str, set[int]] = {
-            "five_hour": set(),
-            "seven_day": set(),
-        }
+        # Thresholds already notified for each period, as a bitmask where
+        # bit i stands for self.thresholds[i]
+        self._notified: dict[str, int] = {period: 0 for period, _ in self._PERIODS}
 
     def check_and_notify(self, usage_data: dict[str, Any]) -> list[str]:
         """
         Check usage data and send notifications if thresholds crossed.
 
+        All periods that crossed a threshold are reported in a single toast,
+        at the highest threshold each one newly reached.
+
         Args:
             usage_data: API response containing usage information
 
         Returns:
-            List of notification messages that were sent
+            List of notification messages that were sent, one per period
         """
-        notifications_sent = []
+        pending: list[tuple[str, float, int, str | None]] = []
+        thresholds = self.thresholds
 
-        for period in ["five_hour", "seven_day"]:
-            data = usage_data.get(period)
-            if not data:
-                continue
+        # Periods can be missing or null in the API response
+        active = [
+            (period, label, data)
+            for period, label in self._PERIODS
+            if (data := usage_data.get(period))
+        ]
 
+        for period, label, data in active:
             utilization = data.get("utilization", 0)
-            resets_at = data.get("resets_at")
-
-            # Check each threshold
-            for threshold in self.thresholds:
-                if (
-                    utilization >= threshold
-                    and threshold not in self._notified[period]
-                ):
-                    self._notified[period].add(threshold)
-                    msg = self._send_threshold_notification(
-                        period, utilization, threshold, resets_at
-                    )
-                    if msg:
-                        notifications_sent.append(msg)
+            notified = self._notified[period]
+
+            # Thresholds are sorted, so the reached ones are the low bits
+            reached = bisect.bisect_right(thresholds, utilization)
+            new = ((1 << reached) - 1) & ~notified
+            if new:
+                self._notified[period] = notified | new
+                # Report the highest newly reached threshold
+                crossed = thresholds[new.bit_length() - 1]
+                pending.append((label, utilization, crossed, data.get("resets_at")))
 
             # Reset notifications when usage drops below minimum threshold
-            if utilization < min(self.thresholds):
-                if self._notified[period]:
-                    logger.info(f"Usage reset for {period}, clearing notifications")
-                    self._notified[period].clear()
-
-        return notifications_sent
-
-    def _send_threshold_notification(
-        self, period: str, usage: float, threshold: int, resets_at: str | None
-    ) -> str | None:
-        """Send notification for threshold being crossed."""
-        period_name = "5-hour" if period == "five_hour" else "Weekly"
-
-        if resets_at:
-            reset_time = format_relative_time(resets_at)
-            message = f"{period_name} limit at {int(usage)}%\nResets {reset_time}"
-        else:
-            message = f"{period_name} limit at {int(usage)}%"
+            if not reached and notified:
+                logger.info("Usage reset for %s, clearing notifications", period)
+                self._notified[period] = 0
+
+        if not pending:
+            return []
+        return self._send_batched_notification(pending)
 
-        title = f"Claude Usage: {int(usage)}%"
-        urgent = threshold >= 90
+    def _send_batched_notification(
+        self, pending: list[tuple[str, float, int, str | None]]
+    ) -> list[str]:
+        """
+        Send one toast for every period that crossed a threshold.
+
+        Args:
+            pending: (period label, usage, threshold crossed, resets_at) per period
+
+        Returns:
+            List of notification messages that were sent, one per period
+        """
+        now = datetime.now(timezone.utc)
+        single = len(pending) == 1
+        lines = []
+        for period_name, usage, _, resets_at in pending:
+            line = f"{period_name} limit at {int(usage)}%"
+            if resets_at:
+                # Keep each period to one line when several share the toast
+                reset_time = format_relative_time(resets_at, now)
+                line += f"\nResets {reset_time}" if single else f", resets {reset_time}"
+            lines.append(line)
+
+        if single:
+            title = f"Claude Usage: {int(pending[0][1])}%"
+        else:
+            title = f"Claude Usage Alert ({len(pending)} limits)"
 
         success = send_notification(
             title=title,
-            message=message,
-            urgent=urgent,
+            message="\n".join(lines),
+            urgent=any(threshold >= 90 for _, _, threshold, _ in pending),
             launch_url="https://claude.ai",
         )
-
-        if success:
-            logger.info(f"Threshold notification: {period} at {usage}% (threshold {threshold}%)")
-            return f"{period_name}: {int(usage)}%"
-        return None
+        if not success:
+            return []
+
+        for period_name, usage, threshold, _ in pending:
+            logger.info(
+                "Threshold notification: %s at %s%% (threshold %s%%)",
+                period_name,
+                usage,
+                threshold,
+            )
+        return [f"{period_name}: {int(usage)}%" for period_name, usage, _, _ in pending]
 
     def send_auth_error_notification(self) -> None:
         """Send notification about authentication error."""
@@ -161,15 +206,15 @@ class NotificationManager:
             period: Specific period to reset, or None to reset all
         """
         if period:
-            self._notified[period].clear()
+            self._notified[period] = 0
         else:
             for p in self._notified:
-                self._notified[p].clear()
-        logger.info(f"Reset notifications for {period or 'all periods'}")
+                self._notified[p] = 0
+        logger.info("Reset notifications for %s", period or "all periods")
 
     def update_thresholds(self, thresholds: list[int]) -> None:
         """Update notification thresholds."""
         self.thresholds = sorted(thresholds)
         # Reset notifications when thresholds change
         self.reset_notifications()
-        logger.info(f"Updated thresholds to {self.thresholds}")
+        logger.info("Updated thresholds to %s", self.thresholds)
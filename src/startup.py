@@ -6,6 +6,10 @@ import winreg
 APP_NAME = "Claudometer"
 REG_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
+# Cached is_startup_enabled() result. This app is the only writer of its Run
+# value, so the cache only changes when enable/disable_startup succeed.
+_startup_cache: bool | None = None
+
 
 def get_executable_path() -> str:
     """Get path to executable (frozen exe or python script)."""
@@ -18,7 +22,21 @@ def get_executable_path() -> str:
 
 
 def is_startup_enabled() -> bool:
-    """Check if startup registry entry exists."""
+    """Check if startup registry entry exists (cached after the first call)."""
+    global _startup_cache
+    if _startup_cache is None:
+        _startup_cache = _query_startup_enabled()
+    return _startup_cache
+
+
+def invalidate_startup_cache() -> None:
+    """Force the next is_startup_enabled() call to re-read the registry."""
+    global _startup_cache
+    _startup_cache = None
+
+
+def _query_startup_enabled() -> bool:
+    """Read the startup registry entry."""
     try:
         with winreg.OpenKey(
             winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_READ
@@ -31,14 +49,17 @@ def is_startup_enabled() -> bool:
 
 def enable_startup() -> None:
     """Add registry entry to start app on Windows login."""
+    global _startup_cache
     with winreg.OpenKey(
         winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_WRITE
     ) as key:
         winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, get_executable_path())
+    _startup_cache = True
 
 
 def disable_startup() -> None:
     """Remove registry entry."""
+    global _startup_cache
     try:
         with winreg.OpenKey(
             winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_WRITE
@@ -46,3 +67,12 @@ def disable_startup() -> None:
             winreg.DeleteValue(key, APP_NAME)
     except FileNotFoundError:
         pass  # Already removed
+    _startup_cache = False
+
+
+def set_startup(enabled: bool) -> None:
+    """Enable or disable starting the app on Windows login."""
+    if enabled:
+        enable_startup()
+    else:
+        disable_startup()
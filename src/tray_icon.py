@@ -1,16 +1,27 @@
 """System tray icon management."""
 
 import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Callable
 
 import pystray
 from PIL import Image
 
 from .icon_generator import IconGenerator
-from .utils import format_relative_time, open_file_in_editor, open_url
+from .utils import (
+    format_relative_time_dt,
+    open_file_in_editor,
+    open_url,
+    parse_iso_timestamp,
+)
 
 logger = logging.getLogger(__name__)
 
+# Delay used to coalesce bursts of icon updates into one tray refresh
+UPDATE_DEBOUNCE_SECONDS = 0.08
+
 
 class TrayIconManager:
     """Manages the system tray icon and menu."""
@@ -32,11 +43,37 @@ class TrayIconManager:
         self.on_refresh = on_refresh
         self.on_exit = on_exit
         self.config_path = config_path
+        self._config_path_obj = Path(config_path) if config_path else None
 
         self.icon_generator = IconGenerator()
+        # Loading and error icons come from a small fixed set, so render them
+        # up front; unknown error types use the generic "error" icon
+        self._static_icons: dict[str, Image.Image] = {
+            "loading": self.icon_generator.create_loading_icon(),
+            **{
+                state: self.icon_generator.create_error_icon(state)
+                for state in ("auth_expired", "network_error", "rate_limited", "error")
+            },
+        }
         self.icon: pystray.Icon | None = None
         self.current_usage: dict[str, Any] | None = None
         self.error_state: str | None = None
+        # resets_at of each period, parsed once per update_usage call
+        self._reset_times: dict[str, datetime | None] = {}
+        # Fields of the last usage data that drive the icon and tooltip
+        self._last_usage_sig: tuple | None = None
+
+        # Icon image and tooltip last pushed to the tray, to skip no-op updates
+        self._last_icon: Image.Image | None = None
+        self._last_title: str | None = None
+
+        # Debounced refresh state; the first update is applied immediately
+        self._debounce_lock = threading.Lock()
+        self._pending_timer: threading.Timer | None = None
+        self._first_update_done = False
+
+        # The menu is static, so build it once and reuse it across restarts
+        self._menu = self._create_menu()
 
     def _create_menu(self) -> pystray.Menu:
         """Create the context menu for the tray icon."""
@@ -61,9 +98,8 @@ class TrayIconManager:
 
     def _handle_open_config(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
         """Handle open config menu click."""
-        if self.config_path:
-            from pathlib import Path
-            open_file_in_editor(Path(self.config_path))
+        if self._config_path_obj:
+            open_file_in_editor(self._config_path_obj)
         else:
             logger.warning("Config path not set")
 
@@ -83,18 +119,19 @@ class TrayIconManager:
             return "Claude Monitor\nLoading..."
 
         lines = ["Claude Monitor"]
+        now = datetime.now(timezone.utc)
 
         five = self.current_usage.get("five_hour")
         if five:
             pct = five.get("utilization", 0)
-            reset = format_relative_time(five.get("resets_at"))
+            reset = format_relative_time_dt(self._reset_times.get("five_hour"), now)
             status = "OK" if pct < 75 else ("HIGH" if pct < 90 else "CRIT")
             lines.append(f"5hr: {pct:.0f}% [{status}] {reset}")
 
         seven = self.current_usage.get("seven_day")
         if seven:
             pct = seven.get("utilization", 0)
-            reset = format_relative_time(seven.get("resets_at"))
+            reset = format_relative_time_dt(self._reset_times.get("seven_day"), now)
             status = "OK" if pct < 75 else ("HIGH" if pct < 90 else "CRIT")
             lines.append(f"Wk: {pct:.0f}% [{status}] {reset}")
 
@@ -123,13 +160,13 @@ class TrayIconManager:
     def _get_current_icon(self) -> Image.Image:
         """Get the appropriate icon for current state."""
         if self.error_state:
-            return self.icon_generator.create_error_icon(self.error_state)
+            return self._static_icons.get(self.error_state, self._static_icons["error"])
 
         if not self.current_usage:
-            return self.icon_generator.create_loading_icon()
+            return self._static_icons["loading"]
 
-        five_hour = self.current_usage.get("five_hour", {}).get("utilization", 0)
-        seven_day = self.current_usage.get("seven_day", {}).get("utilization", 0)
+        five_hour = (self.current_usage.get("five_hour") or {}).get("utilization", 0)
+        seven_day = (self.current_usage.get("seven_day") or {}).get("utilization", 0)
 
         return self.icon_generator.create_usage_icon(five_hour, seven_day)
 
@@ -140,7 +177,31 @@ class TrayIconManager:
         Args:
             usage_data: API response containing usage information
         """
+        five = usage_data.get("five_hour") or {}
+        seven = usage_data.get("seven_day") or {}
+        extra = usage_data.get("extra_usage") or {}
+        sig = (
+            five.get("utilization"),
+            five.get("resets_at"),
+            seven.get("utilization"),
+            seven.get("resets_at"),
+            extra.get("is_enabled"),
+            extra.get("used_credits"),
+            extra.get("monthly_limit"),
+        )
         self.current_usage = usage_data
+
+        if sig == self._last_usage_sig and self.error_state is None:
+            # Same data as last time: keep the icon and parsed reset times,
+            # only the relative times in the tooltip can have moved on
+            self._update_icon()
+            return
+
+        self._last_usage_sig = sig
+        self._reset_times = {
+            "five_hour": parse_iso_timestamp(five.get("resets_at")),
+            "seven_day": parse_iso_timestamp(seven.get("resets_at")),
+        }
         self.error_state = None
         self._update_icon()
 
@@ -160,30 +221,75 @@ class TrayIconManager:
         self._update_icon()
 
     def _update_icon(self) -> None:
+        """
+        Schedule a tray icon and tooltip update.
+
+        Calls within UPDATE_DEBOUNCE_SECONDS of each other are collapsed into
+        a single refresh of the latest state.
+        """
+        if not self.icon:
+            return
+
+        with self._debounce_lock:
+            if self._pending_timer:
+                self._pending_timer.cancel()
+                self._pending_timer = None
+
+            if self._first_update_done:
+                timer = threading.Timer(UPDATE_DEBOUNCE_SECONDS, self._flush_update)
+                timer.daemon = True
+                self._pending_timer = timer
+                timer.start()
+                return
+
+            # Show the first real state without waiting
+            self._first_update_done = True
+        self._flush_update()
+
+    def _flush_update(self) -> None:
+        """Apply the pending icon update."""
+        with self._debounce_lock:
+            self._pending_timer = None
+            self._do_update_icon()
+
+    def _do_update_icon(self) -> None:
         """Update the tray icon and tooltip."""
         if not self.icon:
             return
 
         try:
-            self.icon.icon = self._get_current_icon()
+            # IconGenerator caches its images, so an unchanged icon is the
+            # same object as the one already shown
+            icon_image = self._get_current_icon()
             tooltip = self._build_tooltip()
             # Windows tray tooltips are limited to 128 characters
             if len(tooltip) > 128:
                 tooltip = tooltip[:125] + "..."
-            self.icon.title = tooltip
+
+            # Each setter is a separate Shell_NotifyIcon call, so only push
+            # what changed
+            if icon_image is not self._last_icon:
+                self.icon.icon = icon_image
+                self._last_icon = icon_image
+            if tooltip != self._last_title:
+                self.icon.title = tooltip
+                self._last_title = tooltip
         except Exception as e:
-            logger.error(f"Failed to update icon: {e}")
+            logger.error("Failed to update icon: %s", e)
 
     def start(self, on_ready: Callable[[], None] | None = None) -> None:
         """Start the tray icon (blocks the main thread)."""
-        initial_icon = self.icon_generator.create_loading_icon()
+        initial_icon = self._static_icons["loading"]
+        initial_title = "Claude Monitor\nLoading..."
 
         self.icon = pystray.Icon(
             "claude_monitor",
             initial_icon,
-            "Claude Monitor\nLoading...",
-            self._create_menu(),
+            initial_title,
+            self._menu,
         )
+        self._last_icon = initial_icon
+        self._last_title = initial_title
 
         logger.info("Starting tray icon")
 
@@ -196,6 +302,11 @@ class TrayIconManager:
 
     def stop(self) -> None:
         """Stop the tray icon."""
+        with self._debounce_lock:
+            if self._pending_timer:
+                self._pending_timer.cancel()
+                self._pending_timer = None
+
         if self.icon:
             logger.info("Stopping tray icon")
             self.icon.stop()
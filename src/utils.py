@@ -4,15 +4,13 @@ import logging
 import os
 import subprocess
 import sys
-import winreg
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-APP_NAME = "ClaudeUsageMonitor"
-STARTUP_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+_IS_WIN = sys.platform == "win32"
 
 
 def setup_logging(log_dir: Path, debug: bool = False) -> logging.Logger:
@@ -34,12 +32,14 @@ def setup_logging(log_dir: Path, debug: bool = False) -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    # File handler with rotation (5MB max, keep 3 backups)
+    # File handler with rotation (5MB max, keep 3 backups); the file is
+    # opened when the first record is written
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=5 * 1024 * 1024,
         backupCount=3,
         encoding="utf-8",
+        delay=True,
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG if debug else logging.INFO)
@@ -62,133 +62,114 @@ def setup_logging(log_dir: Path, debug: bool = False) -> logging.Logger:
     return root_logger
 
 
-def format_relative_time(iso_timestamp: str | None) -> str:
+def parse_iso_timestamp(iso_timestamp: str | None) -> datetime | None:
     """
-    Format an ISO timestamp as relative time (e.g., "in 2h 15m").
+    Parse an ISO 8601 timestamp from the API.
 
     Args:
         iso_timestamp: ISO 8601 formatted timestamp string
 
     Returns:
-        Human-readable relative time string
+        Parsed datetime, or None if missing or malformed
     """
     if not iso_timestamp:
-        return "unknown"
+        return None
 
     try:
-        # Parse ISO timestamp
-        reset_time = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
-        now = datetime.now(timezone.utc)
+        # fromisoformat accepts a trailing "Z" since Python 3.11
+        return datetime.fromisoformat(iso_timestamp)
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Failed to parse timestamp {iso_timestamp}: {e}")
+        return None
 
-        diff = reset_time - now
 
-        if diff.total_seconds() <= 0:
-            return "now"
+def format_relative_time(
+    iso_timestamp: str | None, now: datetime | None = None
+) -> str:
+    """
+    Format an ISO timestamp as relative time (e.g., "in 2h 15m").
 
-        total_seconds = int(diff.total_seconds())
-        days = total_seconds // 86400
-        hours = (total_seconds % 86400) // 3600
-        minutes = (total_seconds % 3600) // 60
+    Args:
+        iso_timestamp: ISO 8601 formatted timestamp string
+        now: Current UTC time, to share one reading across several calls;
+            defaults to the time of the call
 
-        parts = []
-        if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0 and days == 0:  # Only show minutes if less than a day
-            parts.append(f"{minutes}m")
+    Returns:
+        Human-readable relative time string
+    """
+    return format_relative_time_dt(parse_iso_timestamp(iso_timestamp), now)
 
-        if not parts:
-            return "< 1m"
 
-        return "in " + " ".join(parts)
+def format_relative_time_dt(
+    reset_time: datetime | None, now: datetime | None = None
+) -> str:
+    """
+    Format an already-parsed timestamp as relative time (e.g., "in 2h 15m").
 
-    except (ValueError, TypeError) as e:
-        logger.warning(f"Failed to parse timestamp {iso_timestamp}: {e}")
+    Args:
+        reset_time: Timezone-aware datetime, as returned by parse_iso_timestamp
+        now: Current UTC time, to share one reading across several calls;
+            defaults to the time of the call
+
+    Returns:
+        Human-readable relative time string
+    """
+    if reset_time is None:
         return "unknown"
 
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    try:
+        diff = reset_time - now
+    except TypeError as e:
+        # Naive datetimes can't be compared with the current UTC time
+        logger.warning(f"Failed to compare timestamp {reset_time}: {e}")
+        return "unknown"
 
-def get_executable_path() -> str:
-    """Get path to executable (handles both frozen and script mode)."""
-    if getattr(sys, "frozen", False):
-        return sys.executable
-    else:
-        return f'"{sys.executable}" "{Path(__file__).parent / "main.py"}"'
+    if diff.total_seconds() <= 0:
+        return "now"
 
+    hours_total, minutes = divmod(int(diff.total_seconds()) // 60, 60)
+    days, hours = divmod(hours_total, 24)
 
-def is_startup_enabled() -> bool:
-    """Check if app is set to start with Windows."""
-    try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            STARTUP_KEY,
-            0,
-            winreg.KEY_READ,
-        )
-        try:
-            winreg.QueryValueEx(key, APP_NAME)
-            return True
-        except FileNotFoundError:
-            return False
-        finally:
-            winreg.CloseKey(key)
-    except WindowsError as e:
-        logger.error(f"Failed to check startup status: {e}")
-        return False
+    if days:
+        # Only show minutes if less than a day
+        return f"in {days}d {hours}h" if hours else f"in {days}d"
+    if hours:
+        return f"in {hours}h {minutes}m" if minutes else f"in {hours}h"
+    if minutes:
+        return f"in {minutes}m"
+    return "< 1m"
 
 
-def enable_startup() -> bool:
-    """Add app to Windows startup."""
-    try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            STARTUP_KEY,
-            0,
-            winreg.KEY_SET_VALUE,
-        )
-        try:
-            exe_path = get_executable_path()
-            winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, exe_path)
-            logger.info(f"Added to startup: {exe_path}")
-            return True
-        finally:
-            winreg.CloseKey(key)
-    except WindowsError as e:
-        logger.error(f"Failed to enable startup: {e}")
-        return False
+def _os_open(target: str, description: str) -> bool:
+    """
+    Open a file or URL with the platform's default handler without waiting.
 
+    Args:
+        target: File path or URL to open
+        description: What is being opened, for the error log
 
-def disable_startup() -> bool:
-    """Remove app from Windows startup."""
+    Returns:
+        True if the handler was launched
+    """
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            STARTUP_KEY,
-            0,
-            winreg.KEY_SET_VALUE,
-        )
-        try:
-            winreg.DeleteValue(key, APP_NAME)
-            logger.info("Removed from startup")
-            return True
-        except FileNotFoundError:
-            # Already not in startup
-            return True
-        finally:
-            winreg.CloseKey(key)
-    except WindowsError as e:
-        logger.error(f"Failed to disable startup: {e}")
+        if _IS_WIN:
+            os.startfile(target)
+        else:
+            subprocess.Popen(
+                ["xdg-open", target],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+            )
+        return True
+    except Exception as e:
+        logger.error(f"Failed to open {description}: {e}")
         return False
 
 
-def set_startup(enabled: bool) -> bool:
-    """Set startup state."""
-    if enabled:
-        return enable_startup()
-    else:
-        return disable_startup()
-
-
 def open_file_in_editor(file_path: Path) -> bool:
     """
     Open a file in the default text editor.
@@ -199,15 +180,7 @@ def open_file_in_editor(file_path: Path) -> bool:
     Returns:
         True if successful
     """
-    try:
-        if sys.platform == "win32":
-            os.startfile(str(file_path))
-        else:
-            subprocess.run(["xdg-open", str(file_path)], check=True)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to open file: {e}")
-        return False
+    return _os_open(str(file_path), "file")
 
 
 def open_url(url: str) -> bool:
@@ -220,12 +193,4 @@ def open_url(url: str) -> bool:
     Returns:
         True if successful
     """
-    try:
-        if sys.platform == "win32":
-            os.startfile(url)
-        else:
-            subprocess.run(["xdg-open", url], check=True)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to open URL: {e}")
-        return False
+    return _os_open(url, "URL")
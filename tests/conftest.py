@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 
+from src.api_client import ClaudeAPIClient
+
 
 @pytest.fixture
 def sample_usage_response():
@@ -51,6 +53,12 @@ def high_usage_response():
     }
 
 
+@pytest.fixture(scope="module")
+def api_client():
+    """API client shared by a test module, to avoid rebuilding the session."""
+    return ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
+
+
 @pytest.fixture
 def temp_config_dir():
     """Temporary directory for config files."""
@@ -58,9 +66,9 @@ def temp_config_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config():
-    """Sample configuration dictionary."""
+    """Sample configuration dictionary (shared; copy it before modifying)."""
     return {
         "organization_id": "test-org-id-12345",
         "session_cookie": "test-session-cookie-value",
@@ -72,9 +80,9 @@ def sample_config():
     }
 
 
-@pytest.fixture
-def mock_config_file(temp_config_dir, sample_config):
-    """Create a mock config file and return its path."""
-    config_path = temp_config_dir / "config.json"
+@pytest.fixture(scope="session")
+def mock_config_file(tmp_path_factory, sample_config):
+    """Create a shared, read-only mock config file and return its path."""
+    config_path = tmp_path_factory.mktemp("cfg") / "config.json"
     config_path.write_text(json.dumps(sample_config))
     return config_path
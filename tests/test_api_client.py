@@ -13,11 +13,18 @@ from src.api_client import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_api_client(api_client):
+    """Restore the shared client's cookie and failure counter before each test."""
+    api_client._consecutive_failures = 0
+    api_client.update_cookie("test-cookie")
+
+
 class TestClaudeAPIClient:
     """Tests for ClaudeAPIClient class."""
 
     @responses.activate
-    def test_get_usage_success(self, sample_usage_response):
+    def test_get_usage_success(self, api_client, sample_usage_response):
         """Test successful API call returns usage data."""
         responses.add(
             responses.GET,
@@ -26,15 +33,14 @@ class TestClaudeAPIClient:
             status=200,
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-        result = client.get_usage()
+        result = api_client.get_usage()
 
         assert result["five_hour"]["utilization"] == 47.0
         assert result["seven_day"]["utilization"] == 25.0
-        assert client.consecutive_failures == 0
+        assert api_client.consecutive_failures == 0
 
     @responses.activate
-    def test_get_usage_auth_error_401(self):
+    def test_get_usage_auth_error_401(self, api_client):
         """Test 401 response raises AuthenticationError."""
         responses.add(
             responses.GET,
@@ -42,15 +48,13 @@ class TestClaudeAPIClient:
             status=401,
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-
         with pytest.raises(AuthenticationError) as exc_info:
-            client.get_usage()
+            api_client.get_usage()
 
         assert "expired" in str(exc_info.value).lower()
 
     @responses.activate
-    def test_get_usage_auth_error_403(self):
+    def test_get_usage_auth_error_403(self, api_client):
         """Test 403 response raises AuthenticationError."""
         responses.add(
             responses.GET,
@@ -58,13 +62,11 @@ class TestClaudeAPIClient:
             status=403,
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-
         with pytest.raises(AuthenticationError):
-            client.get_usage()
+            api_client.get_usage()
 
     @responses.activate
-    def test_get_usage_rate_limit(self):
+    def test_get_usage_rate_limit(self, api_client):
         """Test 429 response raises RateLimitError with retry-after."""
         responses.add(
             responses.GET,
@@ -73,15 +75,13 @@ class TestClaudeAPIClient:
             headers={"Retry-After": "120"},
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-
         with pytest.raises(RateLimitError) as exc_info:
-            client.get_usage()
+            api_client.get_usage()
 
         assert exc_info.value.retry_after == 120
 
     @responses.activate
-    def test_get_usage_rate_limit_default_retry(self):
+    def test_get_usage_rate_limit_default_retry(self, api_client):
         """Test 429 without Retry-After header uses default."""
         responses.add(
             responses.GET,
@@ -89,15 +89,28 @@ class TestClaudeAPIClient:
             status=429,
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-
         with pytest.raises(RateLimitError) as exc_info:
-            client.get_usage()
+            api_client.get_usage()
 
         assert exc_info.value.retry_after == 60  # Default
 
     @responses.activate
-    def test_get_usage_server_error(self):
+    def test_get_usage_rate_limit_http_date_retry(self, api_client):
+        """Test 429 with an HTTP-date Retry-After falls back to the default."""
+        responses.add(
+            responses.GET,
+            "https://claude.ai/api/organizations/test-org/usage",
+            status=429,
+            headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"},
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            api_client.get_usage()
+
+        assert exc_info.value.retry_after == 60
+
+    @responses.activate
+    def test_get_usage_server_error(self, api_client):
         """Test 500 response raises ClaudeAPIError."""
         responses.add(
             responses.GET,
@@ -105,13 +118,26 @@ class TestClaudeAPIClient:
             status=500,
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
+        with pytest.raises(ClaudeAPIError):
+            api_client.get_usage()
+
+    @responses.activate
+    def test_get_usage_invalid_json(self, api_client):
+        """Test malformed response body raises ClaudeAPIError."""
+        responses.add(
+            responses.GET,
+            "https://claude.ai/api/organizations/test-org/usage",
+            body="<html>not json</html>",
+            status=200,
+        )
 
         with pytest.raises(ClaudeAPIError):
-            client.get_usage()
+            api_client.get_usage()
+
+        assert api_client.consecutive_failures == 1
 
     @responses.activate
-    def test_consecutive_failures_increment(self):
+    def test_consecutive_failures_increment(self, api_client):
         """Test consecutive failures counter increments on errors."""
         responses.add(
             responses.GET,
@@ -119,15 +145,13 @@ class TestClaudeAPIClient:
             body=ConnectionError("Network error"),
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-
         with pytest.raises(NetworkError):
-            client.get_usage()
+            api_client.get_usage()
 
-        assert client.consecutive_failures == 1
+        assert api_client.consecutive_failures == 1
 
     @responses.activate
-    def test_consecutive_failures_reset_on_success(self, sample_usage_response):
+    def test_consecutive_failures_reset_on_success(self, api_client, sample_usage_response):
         """Test consecutive failures counter resets on success."""
         # First call fails
         responses.add(
@@ -143,16 +167,14 @@ class TestClaudeAPIClient:
             status=200,
         )
 
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-
         with pytest.raises(NetworkError):
-            client.get_usage()
+            api_client.get_usage()
 
-        assert client.consecutive_failures == 1
+        assert api_client.consecutive_failures == 1
 
-        result = client.get_usage()
+        result = api_client.get_usage()
         assert result is not None
-        assert client.consecutive_failures == 0
+        assert api_client.consecutive_failures == 0
 
     def test_update_cookie(self):
         """Test cookie can be updated."""
@@ -163,14 +185,27 @@ class TestClaudeAPIClient:
         cookie = client.session.cookies.get("sessionKey", domain="claude.ai")
         assert cookie == "new-cookie"
 
+    def test_update_cookie_unchanged_is_noop(self, monkeypatch, caplog):
+        """Test that updating to the current cookie leaves the jar alone."""
+        client = ClaudeAPIClient("test-org", "same-cookie", "test-device-id")
+        calls = []
+        monkeypatch.setattr(
+            client.session.cookies, "set", lambda *a, **kw: calls.append(a)
+        )
+
+        with caplog.at_level("INFO", logger="src.api_client"):
+            client.update_cookie("same-cookie")
+
+        assert calls == []
+        assert "Session cookie updated" not in caplog.text
+
 
 class TestSessionSetup:
     """Tests for session header configuration."""
 
-    def test_anthropic_headers_present(self):
+    def test_anthropic_headers_present(self, api_client):
         """Test that required anthropic headers are set."""
-        client = ClaudeAPIClient("test-org", "test-cookie", "test-device-id")
-        headers = client.session.headers
+        headers = api_client.session.headers
 
         assert headers["anthropic-client-platform"] == "web_claude_ai"
         assert headers["anthropic-client-version"] == "1.0.0"
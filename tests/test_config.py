@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from src.config import ConfigManager, DEFAULT_CONFIG
+from src.config import ConfigManager, DEFAULT_CONFIG, _default_config
 
 
 class TestConfigManager:
@@ -52,6 +52,7 @@ class TestConfigManager:
 
         assert result is True
         assert config_path.exists()
+        assert not config_path.with_name("config.json.tmp").exists()
 
         # Verify saved content
         saved = json.loads(config_path.read_text())
@@ -119,4 +120,70 @@ class TestConfigManager:
 
         manager = ConfigManager(config_path=config_path)
 
-        assert manager.config == DEFAULT_CONFIG
+        assert manager.config == _default_config()
+
+    def test_config_loaded_on_first_access(self, temp_config_dir):
+        """Test that the file is read on first access, not at construction."""
+        config_path = temp_config_dir / "config.json"
+        manager = ConfigManager(config_path=config_path)
+
+        # Written after the manager was created
+        config_path.write_text(json.dumps({"organization_id": "late-org"}))
+
+        assert manager.config["organization_id"] == "late-org"
+
+    def test_config_setter_replaces_loaded_config(self, mock_config_file):
+        """Test that assigning config replaces the cached values."""
+        manager = ConfigManager(config_path=mock_config_file)
+        assert manager.config["organization_id"] == "test-org-id-12345"
+
+        manager.config = {"organization_id": "other-org"}
+
+        assert manager.config == {"organization_id": "other-org"}
+        assert manager["organization_id"] == "other-org"
+        assert "session_cookie" not in manager
+
+    def test_defaults_not_shared_between_managers(self, temp_config_dir):
+        """Test that editing a loaded config doesn't change the defaults."""
+        config_path = temp_config_dir / "nonexistent.json"
+        manager = ConfigManager(config_path=config_path)
+
+        manager.config["notification_thresholds"].append(95)
+
+        fresh = ConfigManager(config_path=config_path)
+        assert fresh.config["notification_thresholds"] == [50, 75, 90]
+        assert tuple(DEFAULT_CONFIG["notification_thresholds"]) == (50, 75, 90)
+
+    def test_merged_defaults_not_shared(self, temp_config_dir):
+        """Test that defaults merged into a loaded file are copies."""
+        config_path = temp_config_dir / "config.json"
+        config_path.write_text(json.dumps({"organization_id": "test-org"}))
+        manager = ConfigManager(config_path=config_path)
+
+        manager.config["notification_thresholds"].append(95)
+
+        fresh = ConfigManager(config_path=config_path)
+        assert fresh.config["notification_thresholds"] == [50, 75, 90]
+
+    def test_default_config_is_read_only(self):
+        """Test that DEFAULT_CONFIG can't be modified."""
+        with pytest.raises(TypeError):
+            DEFAULT_CONFIG["x"] = 1
+        with pytest.raises(AttributeError):
+            DEFAULT_CONFIG["notification_thresholds"].append(95)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_invalid_utf8_uses_defaults(
+        self, temp_config_dir, monkeypatch, use_orjson
+    ):
+        """Test that a config file that isn't valid UTF-8 falls back to defaults."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("src.json_compat.orjson", None)
+        config_path = temp_config_dir / "config.json"
+        config_path.write_bytes(b"\xff{}")
+
+        manager = ConfigManager(config_path=config_path)
+
+        assert manager.config == _default_config()
@@ -94,10 +94,10 @@ class TestNotificationManager:
         mock_notify.return_value = True
         manager = NotificationManager([50, 75, 90])
 
-        # Cross 75%
+        # Cross 75% (50% and 75% share one toast)
         sample_usage_response["five_hour"]["utilization"] = 76.0
         manager.check_and_notify(sample_usage_response)
-        assert mock_notify.call_count == 2  # 50% and 75%
+        assert mock_notify.call_count == 1
 
         # Usage resets to low value
         sample_usage_response["five_hour"]["utilization"] = 5.0
@@ -106,7 +106,7 @@ class TestNotificationManager:
         # Cross 50% again - should notify
         sample_usage_response["five_hour"]["utilization"] = 51.0
         manager.check_and_notify(sample_usage_response)
-        assert mock_notify.call_count == 3  # One more notification
+        assert mock_notify.call_count == 2  # One more notification
 
     @patch("src.notifications.send_notification")
     def test_both_periods_notified(self, mock_notify, sample_usage_response):
@@ -118,42 +118,64 @@ class TestNotificationManager:
         sample_usage_response["five_hour"]["utilization"] = 76.0
         sample_usage_response["seven_day"]["utilization"] = 80.0
 
+        notifications = manager.check_and_notify(sample_usage_response)
+
+        # Both periods are reported in a single toast
+        assert notifications == ["5-hour: 76%", "Weekly: 80%"]
+        mock_notify.assert_called_once()
+        kwargs = mock_notify.call_args.kwargs
+        assert kwargs["title"] == "Claude Usage Alert (2 limits)"
+        assert kwargs["message"].startswith("5-hour limit at 76%, resets ")
+        assert "\nWeekly limit at 80%, resets " in kwargs["message"]
+        assert kwargs["urgent"] is False
+        assert manager._notified["five_hour"] == 0b011
+        assert manager._notified["seven_day"] == 0b011
+
+    @patch("src.notifications.send_notification")
+    def test_batched_notification_urgent(self, mock_notify, sample_usage_response):
+        """Test a batched toast is urgent if any period crossed 90%."""
+        mock_notify.return_value = True
+        manager = NotificationManager([50, 75, 90])
+
+        sample_usage_response["five_hour"]["utilization"] = 92.0
+        sample_usage_response["seven_day"]["utilization"] = 55.0
+
         manager.check_and_notify(sample_usage_response)
 
-        # Should have notifications for both periods at 50% and 75%
-        assert mock_notify.call_count == 4
+        mock_notify.assert_called_once()
+        assert mock_notify.call_args.kwargs["urgent"] is True
 
     def test_reset_notifications_specific_period(self):
         """Test resetting notifications for specific period."""
         manager = NotificationManager([50, 75, 90])
-        manager._notified["five_hour"] = {50, 75}
-        manager._notified["seven_day"] = {50}
+        manager._notified["five_hour"] = 0b011  # 50 and 75
+        manager._notified["seven_day"] = 0b001  # 50
 
         manager.reset_notifications("five_hour")
 
-        assert manager._notified["five_hour"] == set()
-        assert manager._notified["seven_day"] == {50}
+        assert manager._notified["five_hour"] == 0
+        assert manager._notified["seven_day"] == 0b001
 
     def test_reset_notifications_all(self):
         """Test resetting all notifications."""
         manager = NotificationManager([50, 75, 90])
-        manager._notified["five_hour"] = {50, 75}
-        manager._notified["seven_day"] = {50}
+        manager._notified["five_hour"] = 0b011  # 50 and 75
+        manager._notified["seven_day"] = 0b001  # 50
 
         manager.reset_notifications()
 
-        assert manager._notified["five_hour"] == set()
-        assert manager._notified["seven_day"] == set()
+        assert manager._notified["five_hour"] == 0
+        assert manager._notified["seven_day"] == 0
 
     def test_update_thresholds(self):
         """Test updating thresholds clears notifications."""
         manager = NotificationManager([50, 75, 90])
-        manager._notified["five_hour"] = {50, 75}
+        manager._notified["five_hour"] = 0b011  # 50 and 75
 
         manager.update_thresholds([60, 80, 95])
 
         assert manager.thresholds == [60, 80, 95]
-        assert manager._notified["five_hour"] == set()
+        assert manager._notified["five_hour"] == 0
 
     @patch("src.notifications.send_notification")
     def test_handles_missing_period_data(self, mock_notify):